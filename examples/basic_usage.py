@@ -54,8 +54,7 @@ def metaclass_example():
 
     # Load from dictionary
     config_data = {'debug': True, 'host': 'localhost', 'port': 8080}
-    for key, value in config_data.items():
-        config[key] = value
+    config.update(config_data)
 
     print(f'Config: {config}')
     print(f'Debug mode: {config.debug}')
@@ -96,18 +95,12 @@ def data_container_example():
 
     class DataContainer(ItemMixin, IterMixin):
         def __init__(self, **kwargs):
-            for key, value in kwargs.items():
-                self[key] = value
+            self.update(kwargs)
 
         def to_dict(self):
             """Convert to regular dictionary."""
             return dict(self)
 
-        def update(self, other_dict):
-            """Update with another dictionary."""
-            for key, value in other_dict.items():
-                self[key] = value
-
     # Create data container
     data = DataContainer(name='test', value=123, active=True)
 
@@ -139,8 +132,7 @@ def configuration_manager_example():
                 'max_connections': 100,
                 'timeout': 30,
             }
-            for key, value in defaults.items():
-                self[key] = value
+            self.__dict__.update(defaults)
 
         def load_from_file(self, filename):
             """Simulate loading from file."""
@@ -150,16 +142,15 @@ def configuration_manager_example():
                 'log_level': 'DEBUG',
                 'database_url': 'sqlite:///app.db',
             }
-            for key, value in file_config.items():
-                self[key] = value
+            self.__dict__.update(file_config)
 
         def get(self, key, default=None):
             """Get configuration value with default."""
-            return self[key] if key in self.keys() else default
+            return self.__dict__.get(key, default)
 
         def set(self, key, value):
             """Set configuration value."""
-            self[key] = value
+            self.__dict__[key] = value
 
         def show_config(self):
             """Display current configuration."""
@@ -3,6 +3,11 @@
 
 from __future__ import annotations
 
+import gc
+import pickle  # ruff: ignore[suspicious-pickle-import]
+import weakref
+from typing import ClassVar
+
 try:
     import pytest
 except ImportError:
@@ -14,6 +19,7 @@ from xtclass import (
     AttrMixin,
     AttrSetMixin,
     BaseCls,
+    FrozenBaseCls,
     GetSetDelMixin,
     ItemDelMixin,
     ItemGetMixin,
@@ -71,6 +77,10 @@ class TestItemMixin:
         assert 'name' not in obj.__dict__
         assert 'value' in obj.__dict__
 
+        # Deleting a missing key is a silent no-op
+        del obj['name']
+        assert obj.__dict__ == {'value': 42}
+
     def test_item_mixin_combined(self):
         """Test ItemMixin combined functionality."""
 
@@ -97,6 +107,36 @@ class TestItemMixin:
         assert 42 in obj.values()
         assert ('value', 42) in obj.items()
 
+    def test_item_mixin_views(self):
+        """Test ItemMixin keys/values/items views and membership."""
+
+        class TestClass(ItemMixin):
+            def __init__(self):
+                self.name = 'test'
+
+        obj = TestClass()
+        keys = obj.keys()
+        assert 'name' in obj
+        assert 'missing' not in obj
+
+        # Views reflect later changes to the instance
+        obj['value'] = 42
+        assert list(keys) == ['name', 'value']
+        assert list(obj.values()) == ['test', 42]
+        assert list(obj.items()) == [('name', 'test'), ('value', 42)]
+
+    def test_item_mixin_update(self):
+        """Test ItemMixin.update bulk assignment."""
+
+        class TestClass(ItemMixin):
+            def __init__(self):
+                self.name = 'test'
+
+        obj = TestClass()
+        obj.update({'name': 'changed', 'value': 42}, extra=True)
+        obj.update([('pair', 1)])
+        assert obj.__dict__ == {'name': 'changed', 'value': 42, 'extra': True, 'pair': 1}
+
     def test_item_mixin_error_handling(self):
         """Test ItemMixin error handling."""
 
@@ -125,6 +165,24 @@ class TestAttrMixin:
         assert obj.name == 'test'
         assert obj.nonexistent is None  # Should not raise AttributeError
 
+    def test_attr_get_mixin_dunder_and_get(self):
+        """Test AttrGetMixin keeps dunder probes honest and offers get()."""
+
+        class TestClass(AttrGetMixin):
+            def __init__(self):
+                self.name = 'test'
+
+        obj = TestClass()
+        assert not hasattr(obj, '__missing_protocol__')
+        if pytest:
+            with pytest.raises(AttributeError, match="'TestClass' object has no attribute '__missing_protocol__'") as excinfo:
+                _ = obj.__missing_protocol__
+            assert excinfo.value.name == '__missing_protocol__'
+            assert excinfo.value.obj is obj
+        assert obj.get('name') == 'test'
+        assert obj.get('nonexistent') is None
+        assert obj.get('nonexistent', 'default') == 'default'
+
     def test_attr_set_mixin(self):
         """Test AttrSetMixin."""
 
@@ -201,6 +259,32 @@ class TestIterMixin:
         items = list(obj)
         assert len(items) == 0
 
+    def test_iter_mixin_to_tuple(self):
+        """Test IterMixin.to_tuple raw value view."""
+
+        class TestClass(IterMixin):
+            def __init__(self):
+                self.x = 1.0
+                self.y = 2.0
+                self.label = 'point'
+
+        obj = TestClass()
+        assert obj.to_tuple() == (1.0, 2.0, 'point')
+        assert obj.to_tuple('y', 'x') == (2.0, 1.0)
+        assert obj.to_tuple('x') == (1.0,)
+        if pytest:
+            with pytest.raises(KeyError):
+                obj.to_tuple('missing')
+
+    def test_iter_mixin_returns_dict_iterator(self):
+        """Test IterMixin returns the native dict_items iterator, not a generator."""
+
+        class TestClass(IterMixin):
+            def __init__(self):
+                self.name = 'test'
+
+        assert type(iter(TestClass())) is type(iter({}.items()))
+
 
 class TestReprMixin:
     """Test ReprMixin functionality."""
@@ -231,6 +315,48 @@ class TestReprMixin:
         # The actual format includes the full class path
         assert 'TestClass()' in repr_str
 
+    def test_repr_mixin_empty_uses_class_attrs(self):
+        """Test ReprMixin shows class attributes for empty instances without mutating them."""
+
+        class TestClass(ReprMixin):
+            kind = 'default'
+
+        obj = TestClass()
+        assert repr(obj).endswith("TestClass(kind='default')")
+        assert obj.__dict__ == {}
+
+    def test_repr_mixin_empty_uses_get_dict_override(self):
+        """Test ReprMixin calls an overridden get_dict for empty instances."""
+
+        class Base(ReprMixin):
+            base_attr = 1
+
+        class TestClass(Base):
+            own = 2
+            get_dict = ReDictMixin.get_dict_from_instance
+
+        assert repr(TestClass()).endswith('TestClass(base_attr=1, own=2)')
+        assert repr(Base()).endswith('Base(base_attr=1)')
+
+    def test_repr_prefix_per_class(self):
+        """Test each ReprMixin subclass caches its own repr prefix."""
+
+        class Parent(ReprMixin):
+            pass
+
+        class Child(Parent):
+            pass
+
+        assert Parent.__repr_prefix__ == f'{Parent.__qualname__}('
+        assert Child.__repr_prefix__ == f'{Child.__qualname__}('
+        assert repr(Child()) == f'{Child.__qualname__}()'
+        assert repr(ReprMixin()) == 'ReprMixin()'
+
+        # An instance entry with the same name cannot hijack the prefix
+        obj = Child()
+        obj.__dict__['__repr_prefix__'] = 'Hijacked('
+        assert repr(obj).startswith(f'{Child.__qualname__}(')
+
 
 class TestReDictMixin:
     """Test ReDictMixin functionality."""
@@ -249,6 +375,73 @@ class TestReDictMixin:
         assert isinstance(result, dict)
         # The method should rebuild the dict from instance attributes
 
+    def test_get_dict_from_instance_walks_mro(self):
+        """Test get_dict_from_instance resolves class attributes along the MRO."""
+
+        class Base(ReDictMixin):
+            shared = 'base'
+            shadowed = 'base'
+
+        class TestClass(Base, AttrGetMixin):
+            shared = 'child'
+
+            @property
+            def size(self):
+                return 3
+
+            @classmethod
+            def create(cls):
+                return cls()
+
+            @property
+            def broken(self):
+                raise AttributeError('broken')
+
+            def shadowed(self):
+                return 'method'
+
+        obj = TestClass()
+        assert obj.get_dict_from_instance() == {'shared': 'child', 'size': 3}
+        assert list(obj.__dict__) == ['shared', 'size']
+        # The cached names are reused, not mutated
+        assert list(TestClass().get_dict_from_instance()) == ['shared', 'size']
+
+    def test_get_dict_from_instance_reads_reassigned_class_attrs(self):
+        """Test class attributes reassigned after the first call are read live."""
+
+        class Base(ReDictMixin):
+            timeout = 30
+
+        class TestClass(Base):
+            debug = False
+
+        assert TestClass().get_dict_from_instance() == {'debug': False, 'timeout': 30}
+        TestClass.debug = True
+        Base.timeout = 60
+        assert TestClass().get_dict_from_instance() == {'debug': True, 'timeout': 60}
+        del TestClass.debug
+        assert TestClass().get_dict_from_instance() == {'timeout': 60}
+
+    def test_attrs_added_after_class_creation_are_not_collected(self):
+        """Test every ReDictMixin path ignores class attributes added after creation."""
+
+        class TestClass(ReprMixin):
+            x = 1
+
+        TestClass.y = 2
+        assert TestClass().get_dict_from_instance() == {'x': 1}
+        assert TestClass().get_dict_from_class() == {'x': 1}
+        assert repr(TestClass()).endswith('TestClass(x=1)')
+
+        # Also after a first call has already been made
+        class Other(ReDictMixin):
+            x = 1
+
+        assert Other().get_dict_from_instance() == {'x': 1}
+        Other.y = 2
+        assert Other().get_dict_from_instance() == {'x': 1}
+        assert Other().get_dict_from_class() == {'x': 1}
+
     def test_get_dict_from_class(self):
         """Test get_dict_from_class."""
 
@@ -262,6 +455,22 @@ class TestReDictMixin:
         obj.__dict__ = {}  # Clear the dict
         result = obj.get_dict_from_class()
         assert isinstance(result, dict)
+        assert result == {'class_attr': 'class_value'}
+        assert TestClass.__redict_names__ == ('class_attr',)
+        assert type(obj.__dict__) is dict
+
+    def test_get_dict_from_class_reads_reassigned_class_attrs(self):
+        """Test class attributes reassigned after class creation are read live."""
+
+        class TestClass(ReprMixin):
+            debug = False
+
+        assert repr(TestClass()).endswith('TestClass(debug=False)')
+        TestClass.debug = True
+        assert repr(TestClass()).endswith('TestClass(debug=True)')
+        assert TestClass().get_dict_from_class() == {'debug': True}
+        del TestClass.debug
+        assert repr(TestClass()).endswith('TestClass()')
 
 
 class TestBaseCls:
@@ -295,6 +504,126 @@ class TestBaseCls:
         assert 'TestClass' in repr_str
         assert "name='test'" in repr_str
 
+    def test_base_cls_keeps_mixin_bases(self):
+        """Test BaseCls binds methods directly but still is each mixin."""
+        obj = BaseCls()
+        for mixin in (AttrMixin, ItemMixin, IterMixin, ReprMixin):
+            assert isinstance(obj, mixin)
+        assert '__getitem__' in vars(BaseCls)
+        assert '__repr__' in vars(BaseCls)
+
+    def test_base_cls_direct_instance(self):
+        """Test BaseCls can be used directly without subclassing."""
+        obj = BaseCls()
+        obj['key'] = 'value'
+        obj.name = 'test'
+        assert obj['name'] == 'test'
+        assert obj.key == 'value'
+        assert repr(obj) == "BaseCls(key='value', name='test')"
+
+
+class TestFrozenBaseCls:
+    """Test FrozenBaseCls functionality."""
+
+    def test_repr_cache_and_invalidation(self):
+        """Test FrozenBaseCls caches repr and drops the cache on mutation."""
+
+        class TestClass(FrozenBaseCls):
+            def __init__(self):
+                self.name = 'test'
+
+        obj = TestClass()
+        first = repr(obj)
+        assert first.endswith("TestClass(name='test')")
+        assert repr(obj) is first
+        assert list(obj) == [('name', 'test')]  # Cache is not an attribute
+
+        obj['value'] = 42
+        assert repr(obj).endswith("TestClass(name='test', value=42)")
+        obj.name = 'changed'
+        assert "name='changed'" in repr(obj)
+        del obj['value']
+        assert 'value' not in repr(obj)
+        del obj.name
+        assert repr(obj).endswith('TestClass()')
+        obj.update(name='updated')
+        assert "name='updated'" in repr(obj)
+
+    def test_empty_instance_repr_not_cached(self):
+        """Test an empty instance's repr follows reassigned class attributes."""
+
+        class TestClass(FrozenBaseCls):
+            kind = 'a'
+
+        obj = TestClass()
+        assert repr(obj).endswith("TestClass(kind='a')")
+        TestClass.kind = 'b'
+        assert repr(obj).endswith("TestClass(kind='b')")
+
+    def test_direct_instance(self):
+        """Test FrozenBaseCls can be used directly without subclassing."""
+        obj = FrozenBaseCls()
+        assert repr(obj) == 'FrozenBaseCls()'
+        obj.name = 'test'
+        obj['value'] = 42
+        assert vars(obj) == {'name': 'test', 'value': 42}
+        assert repr(obj) == "FrozenBaseCls(name='test', value=42)"
+
+
+class TestSlots:
+    """Test mixins combined with __slots__ subclasses."""
+
+    def test_slotted_subclass_has_no_dict(self):
+        """Test that mixins do not inject a __dict__ into slotted subclasses."""
+
+        class TestClass(AttrMixin, ItemMixin, IterMixin, ReprMixin):
+            __slots__ = ('name', 'value')
+
+            def __init__(self):
+                self.name = 'test'
+                self.value = 42
+
+        obj = TestClass()
+        assert obj.name == 'test'
+        assert not any('__dict__' in vars(klass) for klass in TestClass.__mro__)
+
+    def test_slotted_iter_and_repr(self):
+        """Test IterMixin and ReprMixin on slot-only instances."""
+
+        class TestClass(IterMixin, ReprMixin):
+            __slots__ = ('name', 'unset', 'value')
+
+            def __init__(self):
+                self.name = 'test'
+                self.value = 42
+
+        obj = TestClass()
+        assert list(obj) == [('name', 'test'), ('value', 42)]
+        assert repr(obj).endswith("TestClass(name='test', value=42)")
+
+    def test_slotted_item_access_raises_attribute_error(self):
+        """Test item access on slot-only instances raises a plain AttributeError."""
+
+        class TestClass(ItemMixin):
+            __slots__ = ('name',)
+
+        obj = TestClass()
+        if pytest:
+            with pytest.raises(AttributeError):
+                _ = obj['name']
+            with pytest.raises(AttributeError):
+                obj['name'] = 'test'
+
+    def test_slotted_attr_get_default(self):
+        """Test AttrGetMixin default on slot-only instances does not recurse."""
+
+        class TestClass(AttrMixin):
+            __slots__ = ('name',)
+
+        obj = TestClass()
+        assert obj.name is None  # Unassigned slot falls back to the default
+        assert obj.nonexistent is None
+
 
 class TestGetSetDelMixin:
     """Test GetSetDelMixin functionality."""
@@ -322,6 +651,11 @@ class TestGetSetDelMixin:
         del obj['name']
         assert 'name' not in obj.__dict__
 
+        # Methods are bound on the class itself, mixins stay in the MRO
+        assert '__setattr__' in vars(GetSetDelMixin)
+        assert isinstance(obj, ItemMixin)
+        assert isinstance(obj, AttrMixin)
+
 
 class TestSetOnceDict:
     """Test SetOnceDict functionality."""
@@ -365,6 +699,47 @@ class TestSetOnceDict:
             except KeyError:
                 pass
 
+    def test_set_once_dict_update(self):
+        """Test SetOnceDict.update keeps the set-once rule per key."""
+        sod = SetOnceDict()
+        sod['fixed'] = 'original'
+        sod['empty'] = None
+
+        sod.update({'fixed': 'changed', 'empty': 'filled', 'new': 1})
+        sod.update([('dup', 'first'), ('dup', 'second')], extra=True)
+
+        assert sod['fixed'] == 'original'
+        assert sod['empty'] == 'filled'
+        assert sod['new'] == 1
+        assert sod['dup'] == 'first'
+        assert sod['extra'] is True
+
+    def test_set_once_dict_update_uses_keys_protocol(self):
+        """Test SetOnceDict.update reads objects with keys() as mappings."""
+        source = SetOnceDict()
+        source['ab'] = 1
+        source['cd'] = None
+
+        sod = SetOnceDict()
+        sod.update(source)
+        assert dict(sod.items()) == {'ab': 1, 'cd': None}
+        assert list(sod.keys()) == ['ab', 'cd']
+        assert 'a' not in sod
+
+    def test_set_once_dict_lookup_helpers(self):
+        """Test SetOnceDict membership, get, len and iteration."""
+        sod = SetOnceDict()
+        sod['key'] = 'value'
+        sod['empty'] = None
+
+        assert 'key' in sod
+        assert 'missing' not in sod
+        assert sod.get('key') == 'value'
+        assert sod.get('missing') is None
+        assert sod.get('missing', 'default') == 'default'
+        assert len(sod) == 2
+        assert list(sod) == ['key', 'empty']
+
     def test_set_once_dict_repr(self):
         """Test SetOnceDict string representation."""
         sod = SetOnceDict()
@@ -373,6 +748,7 @@ class TestSetOnceDict:
         repr_str = repr(sod)
         assert 'key' in repr_str
         assert 'value' in repr_str
+        assert repr_str == repr({'key': 'value'})  # Delegates to dict.__repr__
 
 
 class TestMixinClsMeta:
@@ -457,6 +833,30 @@ class TestMixinClsMeta:
         repr_str = repr(obj)  # ReprMixin
         assert 'TestClass' in repr_str
 
+    def test_mixin_cls_meta_bases(self):
+        """Test MixinClsMeta appends missing mixins in MIXIN_MAP order only once."""
+
+        class First(metaclass=MixinClsMeta):
+            MixinIter = True
+            MixinItem = True
+
+        class Second(First, ItemMixin, metaclass=MixinClsMeta):
+            MixinItem = True
+
+        assert First.__bases__ == (ItemMixin, IterMixin)
+        assert Second.__bases__ == (First, ItemMixin)
+
+    def test_mixin_cls_meta_does_not_keep_bases_alive(self):
+        """Test dynamically created bases can be garbage collected."""
+        refs = []
+        for index in range(3):
+            base = MixinClsMeta(f'Dynamic{index}', (), {'MixinItem': True})
+            MixinClsMeta(f'Child{index}', (base,), {'MixinIter': True})
+            refs.append(weakref.ref(base))
+        del base
+        gc.collect()
+        assert [ref() for ref in refs] == [None, None, None]
+
 
 class TestMixinClsParent:
     """Test MixinClsParent functionality."""
@@ -476,6 +876,12 @@ class TestMixinClsParent:
         assert obj.name == 'test'
         assert obj.nonexistent is None
 
+    def test_mixin_cls_parent_direct_instance(self):
+        """Test MixinClsParent instances keep a __dict__."""
+        obj = MixinClsParent()
+        obj.name = 'test'
+        assert vars(obj) == {'name': 'test'}
+
 
 class TestMixinConfig:
     """Test MixinConfig functionality."""
@@ -496,6 +902,27 @@ class TestMixinConfig:
         assert AttrMixin not in mixins
         assert ReprMixin not in mixins
 
+    def test_get_mixins_order_and_unknown_keys(self):
+        """Test MixinConfig.get_mixins returns a tuple in canonical order."""
+        mixins = MixinConfig.get_mixins({'repr': True, 'unknown': True, 'item': True})
+        assert mixins == (ItemMixin, ReprMixin)
+        assert MixinConfig.get_mixins({}) == ()
+
+    def test_default_mixins_read_only_and_subclass_override(self):
+        """Test DEFAULT_MIXINS cannot drift from the lookup table."""
+        if pytest:
+            with pytest.raises(TypeError):
+                MixinConfig.DEFAULT_MIXINS['extra'] = GetSetDelMixin
+
+        class CustomConfig(MixinConfig):
+            DEFAULT_MIXINS: ClassVar[dict[str, type]] = {'item': ItemMixin, 'extra': GetSetDelMixin}
+
+        assert CustomConfig.get_mixins({'extra': True, 'item': True}) == (ItemMixin, GetSetDelMixin)
+        if pytest:
+            with pytest.raises(TypeError):
+                CustomConfig.DEFAULT_MIXINS['attr'] = AttrMixin
+        assert MixinConfig.get_mixins({'extra': True}) == ()
+
 
 class TestMixinError:
     """Test MixinError functionality."""
@@ -506,6 +933,23 @@ class TestMixinError:
         assert str(error) == 'Test error message'
         assert isinstance(error, Exception)
 
+    def test_mixin_error_with_original(self):
+        """Test MixinError formats and chains the original error."""
+        original = KeyError('key')
+        error = MixinError('Lookup failed', original)
+        assert str(error) == "Lookup failed (Original error: 'key')"
+        assert error.original_error is original
+        assert error.__cause__ is original
+        assert error.args == ('Lookup failed',)
+
+    def test_mixin_error_pickle_round_trip(self):
+        """Test MixinError keeps original_error across pickling."""
+        error = pickle.loads(pickle.dumps(MixinError('m', ValueError('v'))))  # ruff: ignore[suspicious-pickle-usage]
+        assert isinstance(error.original_error, ValueError)
+        assert error.original_error.args == ('v',)
+        assert error.args == ('m',)
+        assert str(error) == 'm (Original error: v)'
+
 
 class TestIntegration:
     """Integration tests."""
@@ -559,8 +1003,7 @@ class TestIntegration:
 
         # Load from dictionary
         config_data = {'debug': True, 'host': 'localhost'}
-        for key, value in config_data.items():
-            config[key] = value
+        config.update(config_data)
 
         # Test all features
         assert config['debug'] is True
@@ -8,6 +8,9 @@ iteration support, and more.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from typing import Any
+
 # Import metaclass functionality
 from .metaclass import MixinClsMeta, MixinClsParent, MixinConfig
 
@@ -27,9 +30,82 @@ class BaseCls(AttrMixin, ItemMixin, IterMixin, ReprMixin):
     - ItemMixin: Dictionary-style item access
     - IterMixin: Iteration over attributes
     - ReprMixin: Enhanced string representation
+
+    The mixins declare empty ``__slots__``, but ``BaseCls`` itself does not,
+    so it can be instantiated directly and its instances always have a
+    ``__dict__``. For slot-only instances combine the mixins directly.
+
+    The hot methods are bound directly in the class body, so lookups stop at
+    ``BaseCls`` instead of walking the mixin chain; the mixins stay in the
+    bases for ``isinstance`` checks and à-la-carte composition.
     """
 
-    pass
+    __getitem__ = ItemMixin.__getitem__
+    __setitem__ = ItemMixin.__setitem__
+    __delitem__ = ItemMixin.__delitem__
+    __contains__ = ItemMixin.__contains__
+    __getattr__ = AttrMixin.__getattr__
+    __iter__ = IterMixin.__iter__
+    __repr__ = ReprMixin.__repr__
+    keys = ItemMixin.keys
+    values = ItemMixin.values
+    items = ItemMixin.items
+    update = ItemMixin.update
+
+
+class FrozenBaseCls(BaseCls):
+    """BaseCls variant that caches its ``repr`` output.
+
+    Meant for objects that are rarely mutated after ``__init__``, such as
+    configuration objects that are logged repeatedly. The cached string lives
+    in a slot next to the ``__dict__`` inherited from ``BaseCls``, so it never
+    shows up in ``__dict__``, iteration or ``repr``; the class can be used
+    directly or subclassed.
+
+    Item and attribute assignment/deletion invalidate the cache; writing to
+    ``__dict__`` directly does not, so only use this class when all mutation
+    goes through the object itself. The representation of an empty instance
+    is built from class attributes and is never cached.
+    """
+
+    __slots__ = ('__repr_cache__',)
+
+    def __repr__(self) -> str:
+        """Return the cached representation, computing it on first use."""
+        try:
+            cached = self.__repr_cache__
+        except AttributeError:  # Slot not assigned yet
+            cached = None
+        if cached is None:
+            cached = super().__repr__()
+            if self.__dict__:  # Class attributes may be reassigned at any time
+                object.__setattr__(self, '__repr_cache__', cached)
+        return cached
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set an item and invalidate the cached representation."""
+        super().__setitem__(key, value)
+        object.__setattr__(self, '__repr_cache__', None)
+
+    def __delitem__(self, key: str) -> None:
+        """Delete an item and invalidate the cached representation."""
+        super().__delitem__(key)
+        object.__setattr__(self, '__repr_cache__', None)
+
+    def update(self, other: Mapping[str, Any] | Iterable[tuple[str, Any]] = (), /, **kwargs: Any) -> None:
+        """Bulk-set items and invalidate the cached representation."""
+        super().update(other, **kwargs)
+        object.__setattr__(self, '__repr_cache__', None)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """Set an attribute and invalidate the cached representation."""
+        super().__setattr__(key, value)
+        object.__setattr__(self, '__repr_cache__', None)
+
+    def __delattr__(self, key: str) -> None:
+        """Delete an attribute and invalidate the cached representation."""
+        super().__delattr__(key)
+        object.__setattr__(self, '__repr_cache__', None)
 
 
 # Public API
@@ -53,8 +129,9 @@ __all__ = [
     'MixinConfig',
     # Utility classes
     'SetOnceDict',
-    # Base class
+    # Base classes
     'BaseCls',
+    'FrozenBaseCls',
     # Exceptions
     'MixinError',
 ]
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, ClassVar
 
 from .mixins import AttrMixin, ItemMixin, IterMixin, ReprMixin
@@ -27,7 +29,8 @@ class MixinClsMeta(type):
     ```
     """
 
-    # 预定义Mixin映射
+    # 预定义Mixin映射；键为标识符形式的字符串字面量，编译期已驻留(interned)，
+    # 与类体中的属性名比较时直接命中指针相等的快速路径
     MIXIN_MAP: ClassVar[dict[str, Any]] = {
         'MixinItem': ItemMixin,
         'MixinAttr': AttrMixin,
@@ -47,37 +50,56 @@ class MixinClsMeta(type):
         Returns:
             创建的新类
         """
-        # 收集需要添加的Mixin类
-        mixin_classes = []
-        for mixin_key, mixin_class in cls.MIXIN_MAP.items():
-            if dct.get(mixin_key):
-                mixin_classes.append(mixin_class)
+        # 收集启用且尚未出现在基类中的Mixin类，避免重复添加
+        extra = tuple(mixin_cls for key, mixin_cls in cls.MIXIN_MAP.items() if dct.get(key) and mixin_cls not in bases)
+        # 未启用任何Mixin(例如只从父类继承功能)或所需Mixin均已在基类中时，原样使用基类元组
+        return super().__new__(cls, name, bases + extra if extra else bases, dct)
 
-        # 优化基类列表构建
-        new_bases = list(bases)
-        existing_mixins = {base for base in bases if base in cls.MIXIN_MAP.values()}
 
-        for mixin_cls in mixin_classes:
-            if mixin_cls not in existing_mixins:
-                new_bases.append(mixin_cls)
+def _build_mixin_table(mixins: Mapping[str, Any]) -> dict[frozenset[str], tuple[type, ...]]:
+    """预先计算所有配置组合对应的Mixin类元组.
 
-        return super().__new__(cls, name, tuple(new_bases), dct)
+    Args:
+        mixins: 配置键到Mixin类的映射，其顺序即返回元组中的顺序
+
+    Returns:
+        启用的配置键集合到Mixin类元组的映射，共2**len(mixins)项
+    """
+    keys = tuple(mixins)
+    table: dict[frozenset[str], tuple[type, ...]] = {}
+    for mask in range(1 << len(keys)):
+        enabled = [key for index, key in enumerate(keys) if mask >> index & 1]
+        table[frozenset(enabled)] = tuple(mixins[key] for key in enabled)
+    return table
 
 
 class MixinConfig:
     """Mixin配置类."""
 
-    DEFAULT_MIXINS: ClassVar[dict[str, Any]] = {
+    # 只读映射：_TABLE在类创建时按它一次性生成，原地修改会使两者不一致；
+    # 需要其他组合时在子类中重新定义DEFAULT_MIXINS
+    DEFAULT_MIXINS: ClassVar[Mapping[str, Any]] = MappingProxyType({
         'item': ItemMixin,
         'attr': AttrMixin,
         'iter': IterMixin,
         'repr': ReprMixin,
-    }
+    })
+
+    # 启用的配置键集合 -> Mixin类元组，类定义时一次性生成
+    _TABLE: ClassVar[dict[frozenset[str], tuple[type, ...]]] = _build_mixin_table(DEFAULT_MIXINS)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """子类可能重写DEFAULT_MIXINS，将其冻结为只读映射并重新生成查找表."""
+        super().__init_subclass__(**kwargs)
+        if 'DEFAULT_MIXINS' in vars(cls):
+            cls.DEFAULT_MIXINS = MappingProxyType(dict(cls.DEFAULT_MIXINS))
+        cls._TABLE = _build_mixin_table(cls.DEFAULT_MIXINS)
 
     @classmethod
-    def get_mixins(cls, config: dict[str, bool]) -> list[type]:
-        """根据配置获取Mixin类列表."""
-        return [mixin for key, mixin in cls.DEFAULT_MIXINS.items() if config.get(key)]
+    def get_mixins(cls, config: dict[str, bool]) -> tuple[type, ...]:
+        """根据配置获取Mixin类元组，未知的配置键会被忽略."""
+        mixins = cls.DEFAULT_MIXINS
+        return cls._TABLE[frozenset(key for key, enabled in config.items() if enabled and key in mixins)]
 
 
 class MixinClsParent(metaclass=MixinClsMeta):
@@ -95,5 +117,3 @@ class MixinClsParent(metaclass=MixinClsMeta):
 
     这样MyClass就直接继承了MixinClsParent，并且根据设置的类属性自动获得相应的Mixin功能。
     """
-
-    pass
@@ -3,8 +3,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     pass
@@ -20,19 +20,64 @@ class MixinError(Exception):
     def __init__(self, message: str, original_error: Exception | None = None) -> None:
         """Initialize MixinError.
 
+        ``args`` holds only the message; the original error is appended in
+        ``__str__`` and also recorded as ``__cause__`` for traceback chaining.
+
         Args:
             message: Error message describing the issue
             original_error: The original exception that caused this error
         """
         super().__init__(message)
         self.original_error = original_error
-        self.message = message
+        if original_error is not None:
+            self.__cause__ = original_error
 
     def __str__(self) -> str:
         """Return string representation of the error."""
-        if self.original_error:
-            return f'{self.message} (Original error: {self.original_error})'
-        return self.message
+        message = super().__str__()
+        if self.original_error is not None:
+            return f'{message} (Original error: {self.original_error})'
+        return message
+
+
+def _slot_attrs(obj: Any) -> dict[str, Any]:
+    """按MRO收集仅定义__slots__(没有__dict__)的实例中已赋值的槽属性.
+
+    Args:
+        obj: 要收集属性的实例
+
+    Returns:
+        槽属性名到值的字典，未赋值的槽会被跳过
+    """
+    attrs: dict[str, Any] = {}
+    for klass in reversed(type(obj).__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        for key in (slots,) if isinstance(slots, str) else slots:
+            if key.startswith('__'):  # __dict__、__weakref__等内部槽
+                continue
+            try:
+                attrs[key] = object.__getattribute__(obj, key)
+            except AttributeError:
+                continue
+    return attrs
+
+
+def _own_fields(cls: type) -> dict[str, Any]:
+    """按类创建时收集的属性名(__redict_names__)从类自身的字典中实时读取属性值.
+
+    只取定义在类自身上的属性(保持定义顺序)，从基类继承的属性由get_dict_from_instance收集。
+
+    vars(cls)是类字典的只读MappingProxyType视图，读取时不会复制类字典。
+    已被删除或重新赋值为可调用对象的属性会被跳过。
+
+    Args:
+        cls: ReDictMixin的子类
+
+    Returns:
+        属性名到当前值的新字典
+    """
+    namespace = vars(cls)
+    return {key: namespace[key] for key in cls.__redict_names__ if key in namespace and not callable(namespace[key])}
 
 
 class ItemGetMixin:
@@ -42,6 +87,8 @@ class ItemGetMixin:
     直接从实例的__dict__中获取值，如果键不存在则返回None。
     """
 
+    __slots__ = ()
+
     def __getitem__(self, key: str) -> Any:
         """获取指定键的值.
 
@@ -52,14 +99,9 @@ class ItemGetMixin:
             属性值，如果不存在则返回None
 
         Raises:
-            MixinError: 当获取属性时发生错误
+            AttributeError: 当实例没有__dict__时(例如仅定义了__slots__)
         """
-        try:
-            return self.__dict__.get(key)
-        except AttributeError as e:
-            raise MixinError('Object has no __dict__ attribute', e) from e
-        except Exception as e:
-            raise MixinError(f"Failed to get item '{key}': {e}", e) from e
+        return self.__dict__.get(key)
 
 
 class ItemSetMixin:
@@ -69,6 +111,8 @@ class ItemSetMixin:
     直接在实例的__dict__中设置键值对。
     """
 
+    __slots__ = ()
+
     def __setitem__(self, key: str, value: Any) -> None:
         """设置指定键的值.
 
@@ -77,14 +121,9 @@ class ItemSetMixin:
             value: 要设置的属性值
 
         Raises:
-            MixinError: 当设置属性时发生错误
+            AttributeError: 当实例没有__dict__时(例如仅定义了__slots__)
         """
-        try:
-            self.__dict__[key] = value
-        except AttributeError as e:
-            raise MixinError('Object has no __dict__ attribute', e) from e
-        except Exception as e:
-            raise MixinError(f"Failed to set item '{key}': {e}", e) from e
+        self.__dict__[key] = value
 
 
 class ItemDelMixin:
@@ -94,54 +133,103 @@ class ItemDelMixin:
     直接从实例的__dict__中删除指定的键值对。
     """
 
+    __slots__ = ()
+
     def __delitem__(self, key: str) -> None:
         """删除指定键的值.
 
         Args:
-            key: 要删除的属性名
+            key: 要删除的属性名，不存在时静默忽略
 
         Raises:
-            MixinError: 当删除属性时发生错误
+            AttributeError: 当实例没有__dict__时(例如仅定义了__slots__)
         """
-        try:
-            self.__dict__.pop(key, None)
-        except AttributeError as e:
-            raise MixinError('Object has no __dict__ attribute', e) from e
-        except Exception as e:
-            raise MixinError(f"Failed to delete item '{key}': {e}", e) from e
+        self.__dict__.pop(key, None)
 
 
 class ItemMixin(ItemGetMixin, ItemSetMixin, ItemDelMixin):
-    """统一的字典风格访问Mixin."""
+    """统一的字典风格访问Mixin.
 
-    def keys(self) -> list[str]:
-        """返回所有键的列表."""
-        return list(self.__dict__.keys())
+    keys/values/items直接返回__dict__的视图而不是列表副本，视图会随实例属性实时变化。
+    """
+
+    __slots__ = ()
+
+    def __contains__(self, key: object) -> bool:
+        """判断实例是否包含指定键."""
+        return key in self.__dict__
+
+    # 保持为普通方法：实测property(attrgetter('__dict__.keys'))式的"C级别名"
+    # 每次访问都要创建绑定方法对象，反而比解释器特化过的方法调用更慢
+    def keys(self) -> KeysView[str]:
+        """返回所有键的视图."""
+        return self.__dict__.keys()
+
+    def values(self) -> ValuesView[Any]:
+        """返回所有值的视图."""
+        return self.__dict__.values()
 
-    def values(self) -> list[Any]:
-        """返回所有值的列表."""
-        return list(self.__dict__.values())
+    def items(self) -> ItemsView[str, Any]:
+        """返回所有键值对的视图."""
+        return self.__dict__.items()
 
-    def items(self) -> list[tuple[str, Any]]:
-        """返回所有键值对的列表."""
-        return list(self.__dict__.items())
+    def update(self, other: Mapping[str, Any] | Iterable[tuple[str, Any]] = (), /, **kwargs: Any) -> None:
+        """批量设置键值对，语义与dict.update相同.
+
+        一次C级的__dict__.update调用代替逐键的__setitem__调用。
+
+        Args:
+            other: 映射或(键, 值)对的可迭代对象
+            **kwargs: 额外的键值对
+        """
+        self.__dict__.update(other, **kwargs)
 
 
 class AttrGetMixin:
-    """提供属性访问功能，支持默认值."""
+    """提供属性访问功能，支持默认值.
+
+    普通属性不存在时返回None；魔术方法式的名称(__xxx__)仍抛出AttributeError，
+    使hasattr、copy/pickle等协议探测得到真实的否定结果。
+    需要自定义默认值时使用get方法。
+    """
+
+    __slots__ = ()
 
     def __getattr__(self, key: str) -> Any:
-        """当属性不存在时返回默认值."""
-        # 避免递归，直接返回None
+        """当属性不存在时返回默认值.
+
+        只重写__getattr__而不是__getattribute__，正常的属性查找仍走C实现，
+        仅在查找失败时才进入这里。
+
+        Raises:
+            AttributeError: 当属性名为魔术方法式名称时
+        """
+        # 查找失败后__dict__中必然没有该键，无需再查字典
+        if key.startswith('__') and key.endswith('__'):
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {key!r}', name=key, obj=self)
         return None
 
+    def get(self, key: str, default: Any = None) -> Any:
+        """获取实例属性，不存在时返回指定的默认值.
+
+        Args:
+            key: 属性名
+            default: 属性不存在时返回的默认值
+
+        Returns:
+            属性值或默认值
+        """
+        return self.__dict__.get(key, default)
+
 
 class AttrSetMixin:
     """提供属性设置(cls.key = value)的功能.
 
-    重写__setattr__方法，在设置属性值时记录日志，然后调用父类的方法完成实际设置。
+    重写__setattr__方法，在设置属性值时记录日志，然后直接调用object.__setattr__完成实际设置。
     """
 
+    __slots__ = ()
+
     def __setattr__(self, key: str, value: Any) -> None:
         """设置属性值并记录日志.
 
@@ -149,22 +237,24 @@ class AttrSetMixin:
             key: 要设置的属性名
             value: 要设置的属性值
         """
-        super().__setattr__(key, value)  # 直接调用父类方法完成设置
+        object.__setattr__(self, key, value)  # 直接调用object方法，省去super()代理对象的创建
 
 
 class AttrDelMixin:
     """提供属性删除(del cls.key)的功能.
 
-    重写__delattr__方法，在删除属性时记录日志，然后调用父类的方法完成实际删除。
+    重写__delattr__方法，在删除属性时记录日志，然后直接调用object.__delattr__完成实际删除。
     """
 
+    __slots__ = ()
+
     def __delattr__(self, key: str) -> None:
         """删除属性并记录日志.
 
         Args:
             key: 要删除的属性名
         """
-        super().__delattr__(key)  # 直接调用父类方法完成删除
+        object.__delattr__(self, key)  # 直接调用object方法，省去super()代理对象的创建
 
 
 class AttrMixin(AttrGetMixin, AttrSetMixin, AttrDelMixin):
@@ -174,7 +264,7 @@ class AttrMixin(AttrGetMixin, AttrSetMixin, AttrDelMixin):
     提供完整的属性操作支持(获取、设置、删除)，其中属性不存在时返回None。
     """
 
-    pass
+    __slots__ = ()
 
 
 class GetSetDelMixin(ItemMixin, AttrMixin):
@@ -182,9 +272,23 @@ class GetSetDelMixin(ItemMixin, AttrMixin):
 
     同时继承了ItemMixin和AttrMixin，提供完整的字典风格下标操作([])
     和属性访问操作(.)的支持，包括获取、设置和删除。
+    常用方法直接绑定在本类上，方法查找无需沿两条Mixin继承链逐级查找。
     """
 
-    pass
+    __slots__ = ()
+
+    __getitem__ = ItemMixin.__getitem__
+    __setitem__ = ItemMixin.__setitem__
+    __delitem__ = ItemMixin.__delitem__
+    __contains__ = ItemMixin.__contains__
+    __getattr__ = AttrMixin.__getattr__
+    __setattr__ = AttrMixin.__setattr__
+    __delattr__ = AttrMixin.__delattr__
+    keys = ItemMixin.keys
+    values = ItemMixin.values
+    items = ItemMixin.items
+    update = ItemMixin.update
+    get = AttrMixin.get
 
 
 class ReDictMixin:
@@ -192,8 +296,35 @@ class ReDictMixin:
 
     主要用于只读限制场景，通过get_dict方法重新构建实例的__dict__。
     提供了两个方法：get_dict_from_instance和get_dict_from_class，分别从实例和类层面收集属性。
+
+    按MRO收集的非魔术、非可调用类属性名在类创建时一次性缓存到__redict_names__中，
+    get_dict_from_instance、get_dict_from_class和repr都按这份名单从类字典中实时取值：
+    类属性被重新赋值或删除后结果随之更新；类创建之后再添加的类属性(包括添加到基类上的)不会被收集。
     """
 
+    __slots__ = ()
+
+    # 按MRO收集的属性名，由__init_subclass__在类创建时生成；只缓存名称，不缓存值
+    __redict_names__: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """在类创建时按MRO收集非魔术方法和非可调用属性名.
+
+        同名属性以MRO中最近的定义为准(子类中的同名方法会屏蔽基类的普通属性)；
+        本类自身的属性排在最前并保持定义顺序。
+        """
+        super().__init_subclass__(**kwargs)
+        seen: set[str] = set()
+        names: list[str] = []
+        for klass in cls.__mro__:
+            for key, value in vars(klass).items():
+                if key in seen:
+                    continue
+                seen.add(key)
+                if not key.startswith('__') and not callable(value):
+                    names.append(key)
+        cls.__redict_names__ = tuple(names)
+
     def get_dict_from_instance(self) -> dict[str, Any]:
         """从实例层面收集所有非魔术方法和非可调用属性到__dict__.
 
@@ -201,17 +332,28 @@ class ReDictMixin:
             包含实例所有属性的字典
         """
         if not hasattr(self, '__dict__') or not self.__dict__:
-            # 优化：使用更高效的方式收集属性，避免重复调用getattr
-            attrs = {}
-            for key in dir(self):
-                if not key.startswith('__'):
+            # 按缓存的属性名从MRO各类字典中实时取值，不再使用dir()和逐个getattr，
+            # 也不会经过AttrGetMixin.__getattr__把不存在的属性当作None收集；按属性名排序，与dir()的顺序一致
+            cls = type(self)
+            namespaces = [vars(klass) for klass in cls.__mro__]
+            attrs: dict[str, Any] = {}
+            for key in sorted(cls.__redict_names__):
+                for namespace in namespaces:
+                    if key in namespace:
+                        value = namespace[key]
+                        break
+                else:  # 类属性已被删除
+                    continue
+                # property、classmethod等描述符按实例取值，取值失败或结果可调用时跳过
+                getter = getattr(type(value), '__get__', None)
+                if getter is not None:
                     try:
-                        value = getattr(self, key)
-                        if not callable(value):
-                            attrs[key] = value
+                        value = getter(value, self, cls)
                     except AttributeError:
                         continue
-            self.__dict__ = attrs
+                if not callable(value):
+                    attrs[key] = value
+            object.__setattr__(self, '__dict__', attrs)  # 绕过子类/Mixin的__setattr__钩子
         return self.__dict__
 
     def get_dict_from_class(self) -> dict[str, Any]:
@@ -221,12 +363,10 @@ class ReDictMixin:
             包含类所有属性的字典
         """
         if not hasattr(self, '__dict__') or not self.__dict__:
-            # 优化：直接从类字典中过滤，避免重复计算
-            attrs = {}
-            for key, value in self.__class__.__dict__.items():
-                if not key.startswith('__') and not callable(value):
-                    attrs[key] = value
-            self.__dict__ = attrs
+            # 按类创建时收集好的属性名实时取值，无需再扫描类字典；类没有可收集的属性时不重建__dict__
+            class_dict = _own_fields(type(self))
+            if class_dict:
+                object.__setattr__(self, '__dict__', class_dict)  # 绕过子类/Mixin的__setattr__钩子
 
         return self.__dict__
 
@@ -237,12 +377,43 @@ class IterMixin:
     """提供迭代功能的混合类.
 
     使继承该类的对象可以直接用于for循环，迭代其__dict__中的所有键值对。
-    支持Python的Iterable接口。
+    支持Python的Iterable接口；仅定义__slots__的子类则迭代已赋值的槽属性。
     """
 
+    __slots__ = ()
+
     def __iter__(self) -> Iterator[tuple[str, Any]]:
-        """返回一个迭代器，用于迭代实例的所有属性."""
-        yield from self.__dict__.items()
+        """返回一个迭代器，用于迭代实例的所有属性.
+
+        直接返回dict_items的C级迭代器，不再创建生成器帧。
+        """
+        try:
+            return iter(self.__dict__.items())
+        except AttributeError:  # 子类只定义了__slots__，没有__dict__
+            return iter(_slot_attrs(self).items())
+
+    def to_tuple(self, *names: str) -> tuple[Any, ...]:
+        """返回属性值组成的原始元组.
+
+        元组中只有值本身，可以直接传给Numba的@njit函数等只接受定长参数的原生代码。
+        应在热循环之前取出一次，不要在循环内反复访问对象属性。
+
+        Args:
+            *names: 按顺序要取出的属性名，省略时按__dict__顺序返回全部属性值
+
+        Returns:
+            属性值元组
+
+        Raises:
+            KeyError: 当指定的属性不存在时
+        """
+        try:
+            dic = self.__dict__
+        except AttributeError:  # 子类只定义了__slots__，没有__dict__
+            dic = _slot_attrs(self)
+        if not names:
+            return tuple(dic.values())
+        return tuple(map(dic.__getitem__, names))
 
 
 class ReprMixin(ReDictMixin):
@@ -252,22 +423,37 @@ class ReprMixin(ReDictMixin):
     以更易读的格式显示其所有属性。
     """
 
+    __slots__ = ()
+
+    # "ClassName("前缀，在类创建时计算并存放在各个类上，不占用实例空间；
+    # 使用魔术方法式命名，避免被ReDictMixin当作普通类属性收集
+    __repr_prefix__: ClassVar[str] = 'ReprMixin('
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """为每个子类预先计算repr前缀."""
+        super().__init_subclass__(**kwargs)
+        cls.__repr_prefix__ = f'{cls.__qualname__}('
+
     def __repr__(self) -> str:
         """返回对象的字符串表示，包含所有属性.
 
         Returns:
             格式为"ClassName(attr1=value1, attr2=value2, ...)"的字符串
         """
-        # 优化：缓存类名，避免重复访问
-        class_name = self.__class__.__qualname__
-
-        # 使用__dict__，如果为空则调用get_dict()
-        dic = self.__dict__ or self.get_dict()
-
-        # 优化：使用join而不是多次字符串拼接
-        if not dic:
-            return f'{class_name}()'
-
-        # 构建格式为"ClassName(attr1=value1, attr2=value2, ...)"的字符串
-        items = [f'{k}={v!r}' for k, v in dic.items()]
-        return f'{class_name}({", ".join(items)})'
+        # 使用__dict__，如果为空且get_dict仍是默认的get_dict_from_class，则直接读取类属性
+        # (不再重建实例的__dict__)；子类改写了get_dict时照常调用get_dict()；
+        # 仅定义__slots__的子类使用槽属性
+        try:
+            dic = self.__dict__
+        except AttributeError:
+            dic = _slot_attrs(self)
+        else:
+            if not dic:
+                cls = type(self)
+                dic = _own_fields(cls) if cls.get_dict is ReDictMixin.get_dict_from_class else self.get_dict()
+
+        # 列表推导式比生成器更快(join内部会先把生成器转成列表)，{v!r}也无需查找全局repr；
+        # 空字典时body为''，结果为"ClassName()"
+        body = ', '.join([f'{k}={v!r}' for k, v in dic.items()])
+        # 从类上读取前缀，实例__dict__中的同名键(例如经由ItemMixin写入)无法覆盖
+        return f'{type(self).__repr_prefix__}{body})'
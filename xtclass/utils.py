@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping
+from itertools import chain
 from typing import Any
 
 
@@ -31,9 +33,34 @@ class SetOnceDict:
 
         注意：如果键已存在且值不为None，则记录日志但不覆盖原有值。
         """
-        if key in self._dict and self._dict[key] is not None:
-            return
-        self._dict[key] = value
+        # setdefault一次C级查找即可完成"不存在则插入"；仅当原值为None时才需要再次写入
+        d = self._dict
+        if d.setdefault(key, value) is None:
+            d[key] = value
+
+    def update(self, other: Mapping[str, Any] | Iterable[tuple[str, Any]] = (), /, **kwargs: Any) -> None:
+        """批量设置键值对，对每个键应用与__setitem__相同的"仅设置一次"规则.
+
+        在单个方法调用内完成全部写入，避免逐键调用__setitem__的开销。
+        与dict.update相同，有keys()方法的对象(包括另一个SetOnceDict)按other.keys()和other[key]读取，
+        其他对象按(键, 值)对迭代。
+
+        Args:
+            other: 有keys()方法的映射或(键, 值)对的可迭代对象
+            **kwargs: 额外的键值对
+        """
+        d = self._dict
+        setdefault = d.setdefault
+        keys = getattr(other, 'keys', None)
+        if type(other) is dict:  # 普通字典直接使用C级的items视图
+            pairs: Iterable[tuple[Any, Any]] = other.items()
+        elif keys is not None:
+            pairs = ((key, other[key]) for key in keys())  # type: ignore[index]
+        else:
+            pairs = other
+        for key, value in chain(pairs, kwargs.items()):
+            if setdefault(key, value) is None:
+                d[key] = value
 
     def __getitem__(self, key: str) -> Any:
         """获取指定键的值.
@@ -49,10 +76,49 @@ class SetOnceDict:
         """
         return self._dict[key]
 
+    def __contains__(self, key: object) -> bool:
+        """判断是否包含指定键.
+
+        Args:
+            key: 要检查的键
+
+        Returns:
+            键存在时返回True
+        """
+        return key in self._dict
+
+    def __len__(self) -> int:
+        """返回键值对的数量."""
+        return len(self._dict)
+
+    def __iter__(self) -> Iterator[Any]:
+        """返回遍历所有键的迭代器."""
+        return iter(self._dict)
+
+    def keys(self) -> KeysView[Any]:
+        """返回所有键的视图."""
+        return self._dict.keys()
+
+    def items(self) -> ItemsView[Any, Any]:
+        """返回所有键值对的视图."""
+        return self._dict.items()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """获取指定键的值，不存在时返回默认值.
+
+        Args:
+            key: 要获取的键
+            default: 键不存在时返回的默认值
+
+        Returns:
+            键对应的值或默认值
+        """
+        return self._dict.get(key, default)
+
     def __repr__(self) -> str:
         """返回对象的字符串表示.
 
         Returns:
-            内部字典的字符串表示
+            内部字典的字符串表示(直接由C实现的dict.__repr__生成)
         """
         return repr(self._dict)